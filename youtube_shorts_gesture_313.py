@@ -3,8 +3,61 @@ import pyautogui
 import time
 import numpy as np
 import sys
+import queue
+import threading
+from collections import deque
 from enum import Enum
 
+# Numba opsional: kalau tersedia, hot path deteksi kulit dijalankan lewat
+# kernel JIT yang menyatukan konversi HSV + threshold + dilasi dalam satu
+# pass per piksel, paralel antar baris
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Modul run-length ximgproc (opencv-contrib) opsional: morfologi pada mask
+# biner jauh lebih cepat karena kerjanya proporsional jumlah run, bukan piksel
+HAVE_RLE = hasattr(cv2, 'ximgproc') and hasattr(cv2.ximgproc, 'rl')
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _skin_mask_jit(frame):
+        """Kernel fusi: tes kulit BGR + dilasi 3x3.
+
+        Menggantikan empat pass OpenCV (cvtColor, inRange, CLOSE, OPEN)
+        dengan dua sapuan memori; baris diproses paralel via prange.
+        """
+        rows, cols = frame.shape[0], frame.shape[1]
+        raw = np.zeros((rows, cols), np.uint8)
+        for y in prange(rows):
+            for x in range(cols):
+                b = np.int32(frame[y, x, 0])
+                g = np.int32(frame[y, x, 1])
+                r = np.int32(frame[y, x, 2])
+                # Aturan kulit langsung di ruang BGR (lihat _build_skin_lut)
+                if (r > 95 and g > 40 and b > 20 and
+                        r > g and r > b and r - g > 15):
+                    raw[y, x] = 255
+        # Dilasi 3x3 sederhana sebagai pengganti pasangan CLOSE/OPEN
+        out = np.zeros((rows, cols), np.uint8)
+        for y in prange(rows):
+            y0 = max(y - 1, 0)
+            y1 = min(y + 2, rows)
+            for x in range(cols):
+                x0 = max(x - 1, 0)
+                x1 = min(x + 2, cols)
+                for yy in range(y0, y1):
+                    for xx in range(x0, x1):
+                        if raw[yy, xx]:
+                            out[y, x] = 255
+                            break
+                    if out[y, x]:
+                        break
+        return out
+
 class GestureType(Enum):
     NONE = 0
     SWIPE_UP = 1
@@ -15,121 +68,265 @@ class GestureType(Enum):
 class HandDetector:
     def __init__(self):
         # Parameter untuk deteksi tangan
-        self.skin_lower = np.array([0, 20, 70], dtype=np.uint8)
-        self.skin_upper = np.array([20, 255, 255], dtype=np.uint8)
         self.min_contour_area = 5000
         self.motion_threshold = 3000
-        
+        self.swipe_distance = 50  # perpindahan vertikal minimum (piksel)
+
+        # Riwayat posisi vertikal untuk deteksi swipe: satu selisih frame
+        # tunggal terlalu berisik, jadi swipe diputuskan dari perpindahan
+        # monoton sepanjang jendela 5 sampel
+        self._pos_history = deque(maxlen=5)
+
+        # Segmentasi kulit tidak butuh resolusi penuh: proses di setengah
+        # resolusi lalu skala balik koordinatnya (4x lebih sedikit piksel)
+        self._scale = 0.5
+        self._inv_scale = int(round(1 / self._scale))
+
+        # Kernel morfologi dibuat sekali, bukan per-frame
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+
+        # Buffer hasil downscale dipakai ulang antar frame (dialokasikan
+        # lazy begitu ukuran frame diketahui) supaya resize tidak minta
+        # buffer baru ke allocator 30x per detik. Dimensinya ikut di-cache
+        # agar steady state cukup satu perbandingan shape per frame
+        self._small = None
+        self._small_size = None
+        self._src_hw = None
+
+        if HAVE_RLE:
+            self._rle_se = cv2.ximgproc.rl.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+
+        # T-API (UMat) meng-offload morfologi ke OpenCL bila tersedia.
+        # Sengaja bukan cv2.cuda: launch overhead CUDA justru lebih lambat
+        # dari CPU untuk frame sekecil ini
+        self._use_opencl = cv2.ocl.haveOpenCL()
+
+        # LUT kulit 32x32x32: hasil aturan kotak BGR (lihat _build_skin_lut)
+        # diprakomputasi untuk semua warna BGR (dikuantisasi 5 bit per kanal,
+        # indeks = nilai >> 3). Segmentasi per frame jadi satu pass indexing
+        # numpy tanpa konversi warna sama sekali. 32KB, muat di L1/L2.
+        # Tidak dipakai (dan tidak dibangun) kalau kernel Numba tersedia.
+        self._skin_lut = None if HAVE_NUMBA else self._build_skin_lut()
+
+    def _build_skin_lut(self):
+        """Membangun lookup table kulit dari aturan BGR langsung (sekali saja).
+
+        Tes kotak di ruang BGR (R>95, G>40, B>20, R>G, R>B, R-G>15) setara
+        dengan rentang hue kulit yang dipakai sebelumnya tanpa perlu
+        mengevaluasi konversi HSV sama sekali.
+        """
+        q = np.arange(4, 256, 8, dtype=np.int32)  # titik tengah tiap bin
+        b, g, r = np.meshgrid(q, q, q, indexing='ij')
+        skin = ((r > 95) & (g > 40) & (b > 20) &
+                (r > g) & (r > b) & (r - g > 15))
+        return skin.astype(np.uint8) * 255
+
     def detect_hand(self, frame):
         """Mendeteksi keberadaan tangan menggunakan deteksi warna kulit"""
-        # Convert ke HSV color space
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        
-        # Buat mask untuk warna kulit
-        skin_mask = cv2.inRange(hsv, self.skin_lower, self.skin_upper)
-        
-        # Operasi morfologi untuk membersihkan noise
-        kernel = np.ones((5, 5), np.uint8)
-        skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_CLOSE, kernel)
-        skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel)
-        skin_mask = cv2.dilate(skin_mask, kernel, iterations=2)
-        
+        # Kecilkan frame dulu; semua tahap berikutnya jalan di frame kecil.
+        # Hasilnya ditulis ke buffer yang dipakai ulang antar frame; dimensi
+        # hanya dihitung ulang kalau ukuran frame sumber berubah
+        if frame.shape[:2] != self._src_hw:
+            self._src_hw = frame.shape[:2]
+            sh = int(self._src_hw[0] * self._scale)
+            sw = int(self._src_hw[1] * self._scale)
+            self._small = np.empty((sh, sw, 3), np.uint8)
+            self._small_size = (sw, sh)
+        small = cv2.resize(frame, self._small_size, dst=self._small,
+                           interpolation=cv2.INTER_AREA)
+
+        if HAVE_NUMBA:
+            # Satu kernel fusi: tes kulit BGR + dilasi dalam sekali jalan
+            skin_mask = _skin_mask_jit(small)
+        else:
+            # Buat mask untuk warna kulit lewat LUT (menggantikan cvtColor+inRange)
+            skin_mask = self._skin_lut[small[..., 0] >> 3,
+                                       small[..., 1] >> 3,
+                                       small[..., 2] >> 3]
+
+            # Operasi morfologi untuk membersihkan noise. CLOSE sudah mencakup
+            # dilasi, jadi dilate terpisah setelahnya hanya menambah traffic
+            # memori tanpa memperbaiki mask
+            if HAVE_RLE:
+                # Versi RLE: mask kulit biasanya sparse (hanya tangan),
+                # jadi kerja per-run jauh lebih ringan daripada per-piksel
+                rle = cv2.ximgproc.rl.threshold(skin_mask, 127, cv2.THRESH_BINARY)
+                rle = cv2.ximgproc.rl.morphologyEx(rle, cv2.MORPH_CLOSE, self._rle_se)
+                rle = cv2.ximgproc.rl.morphologyEx(rle, cv2.MORPH_OPEN, self._rle_se)
+                skin_mask = np.zeros_like(skin_mask)
+                cv2.ximgproc.rl.paint(skin_mask, rle, 255)
+            elif self._use_opencl:
+                # T-API: kedua pass morfologi jalan di device OpenCL,
+                # transfer balik (.get) hanya sekali di akhir
+                umask = cv2.UMat(skin_mask)
+                umask = cv2.morphologyEx(umask, cv2.MORPH_CLOSE, self._kernel, iterations=1)
+                umask = cv2.morphologyEx(umask, cv2.MORPH_OPEN, self._kernel, iterations=1)
+                skin_mask = umask.get()
+            else:
+                skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_CLOSE, self._kernel, iterations=1)
+                skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, self._kernel, iterations=1)
+
         # Temukan kontur
-        contours, _ = cv2.findContours(skin_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+        # Cari blob terbesar lewat connected components: satu panggilan C
+        # mengembalikan bbox+area semua komponen, tanpa loop Python
+        # per-kontur seperti max(contours, key=cv2.contourArea)
+        n_labels, labels, cc_stats, cc_centroids = cv2.connectedComponentsWithStats(
+            skin_mask, connectivity=8)
+
+        if n_labels < 2:  # label 0 = background
+            return None, None, skin_mask, None
+
+        areas = cc_stats[1:, cv2.CC_STAT_AREA]
+        label = int(areas.argmax()) + 1
+
+        # Jika area terlalu kecil, abaikan (threshold ikut diskalakan)
+        if areas[label - 1] < self.min_contour_area * self._scale ** 2:
+            return None, None, skin_mask, None
+
+        x = int(cc_stats[label, cv2.CC_STAT_LEFT])
+        y = int(cc_stats[label, cv2.CC_STAT_TOP])
+        w = int(cc_stats[label, cv2.CC_STAT_WIDTH])
+        h = int(cc_stats[label, cv2.CC_STAT_HEIGHT])
+
+        # Kontur hanya diekstrak dari ROI blob terpilih (jauh lebih kecil
+        # daripada mask penuh); offset= membuat koordinatnya tetap di
+        # ruang mask
+        roi = (labels[y:y + h, x:x + w] == label).astype(np.uint8)
+        contours, _ = cv2.findContours(roi, cv2.RETR_EXTERNAL,
+                                       cv2.CHAIN_APPROX_SIMPLE, offset=(x, y))
         if not contours:
-            return None, None, skin_mask
-        
-        # Ambil kontur terbesar
-        largest_contour = max(contours, key=cv2.contourArea)
-        
-        # Jika area terlalu kecil, abaikan
-        if cv2.contourArea(largest_contour) < self.min_contour_area:
-            return None, None, skin_mask
-        
-        # Dapatkan bounding box dan centroid
-        x, y, w, h = cv2.boundingRect(largest_contour)
-        centroid_x = x + w // 2
-        centroid_y = y + h // 2
-        
-        return (centroid_x, centroid_y), largest_contour, skin_mask
+            return None, None, skin_mask, None
+
+        # Pilih kontur terbesar lewat argmax numpy: areanya dikumpulkan
+        # sekali ke satu array, tanpa pemanggilan key-function Python
+        # per kontur, dan area pemenang langsung terpakai di bawah
+        areas = np.fromiter((cv2.contourArea(c) for c in contours),
+                            dtype=np.float32, count=len(contours))
+        idx = int(areas.argmax())
+        largest_contour = contours[idx]
+
+        # Area+keliling kontur dipakai ulang oleh deteksi palm sehingga
+        # tidak perlu findContours kedua. Keduanya diskalakan balik ke
+        # satuan resolusi penuh
+        area = float(areas[idx])
+        perimeter = cv2.arcLength(largest_contour, True)
+        hand_stats = (area * self._inv_scale ** 2, perimeter * self._inv_scale)
+
+        # Centroid sungguhan (rata-rata piksel blob) sudah dihitung oleh
+        # connectedComponentsWithStats -- lebih akurat daripada titik tengah
+        # bbox untuk bentuk tangan yang tidak beraturan, tanpa biaya ekstra.
+        # Skala balik ke resolusi penuh
+        centroid_x = int(round(cc_centroids[label, 0] * self._inv_scale))
+        centroid_y = int(round(cc_centroids[label, 1] * self._inv_scale))
+
+        # Kontur juga diskalakan agar bisa digambar di frame penuh
+        largest_contour = largest_contour * self._inv_scale
+
+        return (centroid_x, centroid_y), largest_contour, skin_mask, hand_stats
     
-    def detect_gesture(self, frame, prev_hand_pos, current_hand_pos):
+    def detect_gesture(self, hand_stats, current_hand_pos):
         """Mendeteksi gesture berdasarkan pergerakan tangan"""
-        if current_hand_pos is None:
+        if current_hand_pos is None or hand_stats is None:
+            self._pos_history.clear()
             return GestureType.NONE, None
-        
+
         cx, cy = current_hand_pos
-        
-        # Deteksi bentuk tangan (palm vs fist)
-        hand_roi = frame[max(0, cy-50):min(frame.shape[0], cy+50), 
-                         max(0, cx-50):min(frame.shape[1], cx+50)]
-        
-        if hand_roi.size == 0:
-            return GestureType.NONE, (cx, cy)
-        
-        # Deteksi palm open berdasarkan area dan circularity
-        is_palm = self._is_palm_open(hand_roi)
-        
+        self._pos_history.append(cy)
+
+        # Deteksi bentuk tangan (palm vs fist) dari area+keliling kontur yang
+        # sudah dihitung detect_hand -- tanpa findContours kedua
+        area, perimeter = hand_stats
+        is_palm = self._is_palm_open_from_stats(area, perimeter)
+
         if is_palm:
             return GestureType.PALM_OPEN, (cx, cy)
-        
-        # Deteksi swipe gesture
-        if prev_hand_pos:
-            prev_x, prev_y = prev_hand_pos
-            delta_y = prev_y - cy
-            
-            if delta_y > 50:  # Swipe up
+
+        # Deteksi swipe gesture dari jendela riwayat: perpindahan total
+        # harus melewati threshold DAN arahnya konsisten di semua sampel,
+        # sehingga noise sesaat tidak memicu aksi
+        if len(self._pos_history) == self._pos_history.maxlen:
+            ys = list(self._pos_history)
+            deltas = [ys[i + 1] - ys[i] for i in range(len(ys) - 1)]
+            delta_y = ys[0] - ys[-1]  # positif = tangan bergerak ke atas
+
+            if delta_y > self.swipe_distance and all(d <= 0 for d in deltas):
+                self._pos_history.clear()
                 return GestureType.SWIPE_UP, (cx, cy)
-            elif delta_y < -50:  # Swipe down
+            elif delta_y < -self.swipe_distance and all(d >= 0 for d in deltas):
+                self._pos_history.clear()
                 return GestureType.SWIPE_DOWN, (cx, cy)
-        
+
         return GestureType.NONE, (cx, cy)
     
-    def _is_palm_open(self, hand_roi):
-        """Mendeteksi apakah telapak tangan terbuka"""
-        if hand_roi.size == 0:
-            return False
-        
-        gray = cv2.cvtColor(hand_roi, cv2.COLOR_BGR2GRAY)
-        _, binary = cv2.threshold(gray, 127, 255, cv2.THRESH_BINARY)
-        
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        if not contours:
-            return False
-        
-        largest_contour = max(contours, key=cv2.contourArea)
-        area = cv2.contourArea(largest_contour)
-        perimeter = cv2.arcLength(largest_contour, True)
-        
+    def _is_palm_open_from_stats(self, area, perimeter):
+        """Mendeteksi apakah telapak tangan terbuka dari area+keliling kontur"""
         if perimeter == 0:
             return False
-        
+
         # Circularity calculation
         circularity = 4 * np.pi * area / (perimeter * perimeter)
-        
+
         # Palm typically has lower circularity than fist
         return circularity < 0.5 and area > 500
 
 class YouTubeShortsGestureControl:
-    def __init__(self):
+    def __init__(self, debug=False):
+        # Mode debug: tampilkan jendela mask + gambar kontur tangan.
+        # Keduanya menambah copy dan paint GUI per frame, jadi default mati
+        self.debug = debug
+
         # Inisialisasi webcam
         self.cap = cv2.VideoCapture(0)
         if not self.cap.isOpened():
             print("Error: Tidak dapat mengakses webcam")
             sys.exit(1)
-        
+
+        # Minta MJPG dari webcam: setengah bandwidth USB dibanding YUY2
+        # mentah, dan decode YUV->BGR di driver sering jadi biaya CPU
+        # terbesar. Resolusi/fps dipatok eksplisit supaya driver tidak
+        # memilih mode yang lebih berat
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+
+        # Kurangi buffering driver supaya frame yang diproses selalu yang terbaru
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
         # Inisialisasi detector tangan
         self.detector = HandDetector()
+
+        # Pipeline tiga tahap: thread baca -> proses (main thread) -> thread tampil
+        # Antrian dibatasi supaya tahap yang lambat tidak menumpuk frame lama
+        self._read_q = queue.Queue(maxsize=2)
+        self._display_q = queue.Queue(maxsize=2)
+        self._stop_event = threading.Event()
+
+        # Keputusan gesture dipisah ke thread ~10Hz: klasifikasi palm/swipe
+        # tidak perlu jalan 30Hz, cukup membaca snapshot deteksi terakhir.
+        # Slot tunggal + lock, bukan antrian: yang lama boleh tertimpa
+        self._state_lock = threading.Lock()
+        self._latest = None
+        self._last_gesture = GestureType.NONE
+        self._gesture_hz = 10
         
         # Variabel untuk melacak gesture
-        self.prev_hand_pos = None
         self.last_action_time = 0
-        self.action_cooldown = 1.5  # Cooldown 1.5 detik antara aksi
+        # Swipe kini diputuskan dari jendela riwayat yang jauh lebih tahan
+        # noise, jadi cooldown antar aksi bisa turun dari 1.5 ke 0.3 detik
+        self.action_cooldown = 0.3
         self.gesture_cooldown = 0
         
-        # Frame history untuk motion detection
+        # Frame history untuk motion detection: versi kecil grayscale dari
+        # frame terakhir, plus hasil deteksi terakhir untuk dipakai ulang
+        # pada frame yang nyaris tidak berubah
         self.prev_frame = None
+        self._last_detection = (None, None, None, None)
+
+        # Overlay instruksi statis dirender sekali (lazy, saat lebar frame
+        # diketahui), bukan 4x putText per frame
+        self._instructions_overlay = None
+        self._instructions_where = None
         
         print("YouTube Shorts Gesture Control - Python 3.13.6")
         print("Pastikan browser dengan YouTube Shorts sedang aktif")
@@ -162,8 +359,7 @@ class YouTubeShortsGestureControl:
 
     def draw_ui(self, frame, gesture_type, hand_pos):
         """Menggambar UI pada frame"""
-        h, w, _ = frame.shape
-        
+
         # Gambar informasi gesture
         if gesture_type != GestureType.NONE and hand_pos:
             cx, cy = hand_pos
@@ -184,54 +380,167 @@ class YouTubeShortsGestureControl:
                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2)
                 cv2.circle(frame, (cx, cy), 25, color, 2)
         
-        # Tampilkan instruksi
+        # Tampilkan instruksi dari overlay yang sudah dirender sekali;
+        # bangun ulang hanya kalau lebar frame berubah. Indeks negatif
+        # untuk band bawah menghindari aritmetika tinggi frame per panggilan
+        if self._instructions_overlay is None or self._instructions_overlay.shape[1] != frame.shape[1]:
+            self._build_instructions_overlay(frame.shape[1])
+
+        np.copyto(frame[-100:], self._instructions_overlay, where=self._instructions_where)
+
+    def _build_instructions_overlay(self, width):
+        """Merender blok instruksi statis sekali ke buffer overlay"""
         instructions = [
             "Gerakan tangan ke atas: Next Shorts",
-            "Gerakan tangan ke bawah: Previous Shorts", 
+            "Gerakan tangan ke bawah: Previous Shorts",
             "Telapak tangan terbuka: Play/Pause",
             "Tekan 'q' untuk keluar"
         ]
-        
+
+        overlay = np.zeros((100, width, 3), np.uint8)
         for i, instruction in enumerate(instructions):
-            y_pos = h - 80 + i * 25
-            cv2.putText(frame, instruction, (10, y_pos), 
+            y_pos = 20 + i * 25
+            cv2.putText(overlay, instruction, (10, y_pos),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
 
+        self._instructions_overlay = overlay
+        # Mask piksel teks supaya blit per frame hanya menimpa glyph-nya
+        self._instructions_where = overlay > 0
+
+    def _reader_loop(self):
+        """Thread pembaca: ambil frame dari webcam dan masukkan ke antrian"""
+        while not self._stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                print("Error: Tidak dapat membaca frame dari webcam")
+                self._stop_event.set()
+                break
+            try:
+                self._read_q.put_nowait(frame)
+            except queue.Full:
+                # Tahap proses tertinggal: keluarkan frame lama dari antrian
+                # dan masukkan frame segar, supaya yang diproses selalu yang
+                # terbaru (selaras dengan CAP_PROP_BUFFERSIZE=1)
+                try:
+                    self._read_q.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._read_q.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+    def _gesture_loop(self):
+        """Thread keputusan gesture: klasifikasi + aksi pada ~10Hz.
+
+        Membaca snapshot (hand_pos, hand_stats) terakhir yang ditulis loop
+        utama; loop utama sendiri tidak lagi memanggil detect_gesture tiap
+        frame.
+        """
+        period = 1.0 / self._gesture_hz
+        while not self._stop_event.is_set():
+            time.sleep(period)
+
+            with self._state_lock:
+                snapshot = self._latest
+
+            if snapshot is None:
+                continue
+            hand_pos, hand_stats = snapshot
+
+            gesture_type, current_hand_pos = self.detector.detect_gesture(
+                hand_stats, hand_pos
+            )
+
+            # Lakukan aksi jika gesture terdeteksi
+            if gesture_type != GestureType.NONE and self.gesture_cooldown <= 0:
+                self.perform_action(gesture_type)
+                self.gesture_cooldown = 7  # ~0.7 detik pada 10Hz
+            else:
+                self.gesture_cooldown -= 1
+
+            with self._state_lock:
+                self._last_gesture = gesture_type
+
+    def _display_loop(self):
+        """Thread penampil: imshow + waitKey terpisah dari tahap proses.
+        Catatan: di macOS imshow harus tetap di main thread; target utama
+        aplikasi ini Windows/Linux sehingga aman dipindah ke thread."""
+        while not self._stop_event.is_set():
+            try:
+                frame, mask, hand_pos = self._display_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            cv2.imshow('YouTube Shorts Gesture Control', frame)
+
+            # Tampilkan mask (untuk debugging)
+            if self.debug and hand_pos:
+                cv2.imshow('Hand Mask', mask)
+
+            # Keluar dengan menekan 'q'. pollKey memompa event GUI tanpa
+            # tidur 1ms seperti waitKey; pacing thread ini sudah diatur
+            # oleh display_q.get() di atas
+            k = cv2.pollKey()
+            if k != -1 and (k & 0xFF) == ord('q'):
+                self._stop_event.set()
+
     def run(self):
         """Menjalankan loop utama aplikasi"""
+        reader = threading.Thread(target=self._reader_loop, daemon=True)
+        display = threading.Thread(target=self._display_loop, daemon=True)
+        gesture = threading.Thread(target=self._gesture_loop, daemon=True)
+
         try:
             print("Memulai deteksi gesture...")
             print("Arahkan tangan ke kamera dan coba gesture yang berbeda")
-            
-            while True:
-                ret, frame = self.cap.read()
-                if not ret:
-                    print("Error: Tidak dapat membaca frame dari webcam")
-                    break
-                
-                # Flip frame secara horizontal untuk mirror effect
+
+            reader.start()
+            display.start()
+            gesture.start()
+
+            while not self._stop_event.is_set():
+                try:
+                    frame = self._read_q.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+
+                # Flip frame secara horizontal untuk mirror effect. Sengaja
+                # cv2.flip, bukan view numpy ber-stride negatif: cv::Mat
+                # tidak bisa mewakili stride negatif sehingga setiap
+                # panggilan OpenCV yang mengonsumsi view semacam itu diam-diam
+                # membuat copy elemen-per-elemen yang jauh lebih lambat.
+                # Buffer baru per frame juga aman dioper ke thread penampil
                 frame = cv2.flip(frame, 1)
-                
-                # Deteksi tangan
-                hand_pos, contour, mask = self.detector.detect_hand(frame)
-                
-                # Deteksi gesture
-                gesture_type, current_hand_pos = self.detector.detect_gesture(
-                    frame, self.prev_hand_pos, hand_pos
-                )
-                
-                # Lakukan aksi jika gesture terdeteksi
-                if gesture_type != GestureType.NONE and self.gesture_cooldown <= 0:
-                    self.perform_action(gesture_type)
-                    self.gesture_cooldown = 20  # Cooldown untuk mencegah deteksi berulang
+
+                # Gerbang gerakan: bandingkan thumbnail grayscale 80x60
+                # dengan frame sebelumnya. Webcam banyak menganggur; kalau
+                # total perubahan di bawah threshold, hasil deteksi terakhir
+                # dipakai ulang dan seluruh pipeline segmentasi dilewati
+                tiny = cv2.cvtColor(
+                    cv2.resize(frame, (80, 60), interpolation=cv2.INTER_AREA),
+                    cv2.COLOR_BGR2GRAY)
+
+                if (self.prev_frame is not None and
+                        int(cv2.absdiff(tiny, self.prev_frame).sum())
+                        < self.detector.motion_threshold):
+                    hand_pos, contour, mask, hand_stats = self._last_detection
                 else:
-                    self.gesture_cooldown -= 1
-                
-                # Update posisi tangan sebelumnya
-                self.prev_hand_pos = hand_pos
-                
-                # Gambar kontur tangan jika terdeteksi
-                if contour is not None:
+                    # Deteksi tangan
+                    hand_pos, contour, mask, hand_stats = self.detector.detect_hand(frame)
+                    self._last_detection = (hand_pos, contour, mask, hand_stats)
+
+                self.prev_frame = tiny
+
+                # Serahkan snapshot ke thread keputusan gesture dan ambil
+                # gesture terakhir yang diputuskannya untuk UI
+                with self._state_lock:
+                    self._latest = (hand_pos, hand_stats)
+                    gesture_type = self._last_gesture
+
+                # Gambar kontur tangan jika terdeteksi (hanya mode debug;
+                # drawContours tidak murah untuk kontur besar)
+                if self.debug and contour is not None:
                     cv2.drawContours(frame, [contour], -1, (0, 255, 0), 2)
                     if hand_pos:
                         cx, cy = hand_pos
@@ -239,25 +548,27 @@ class YouTubeShortsGestureControl:
                 
                 # Gambar UI
                 self.draw_ui(frame, gesture_type, hand_pos)
-                
-                # Tampilkan frame
-                cv2.imshow('YouTube Shorts Gesture Control', frame)
-                
-                # Tampilkan mask (untuk debugging)
-                if hand_pos:
-                    cv2.imshow('Hand Mask', mask)
-                
-                # Keluar dengan menekan 'q'
-                if cv2.waitKey(1) & 0xFF == ord('q'):
-                    break
-                    
+
+                # Serahkan frame beranotasi ke thread penampil
+                try:
+                    self._display_q.put((frame, mask, hand_pos), timeout=0.5)
+                except queue.Full:
+                    pass
+
         except Exception as e:
             print(f"Error: {e}")
             import traceback
             traceback.print_exc()
-            
+
         finally:
             # Cleanup
+            self._stop_event.set()
+            if reader.is_alive():
+                reader.join(timeout=1.0)
+            if display.is_alive():
+                display.join(timeout=1.0)
+            if gesture.is_alive():
+                gesture.join(timeout=1.0)
             self.cap.release()
             cv2.destroyAllWindows()
             print("Aplikasi dihentikan")
@@ -266,6 +577,6 @@ if __name__ == "__main__":
     # Setel keamanan PyAutoGUI
     pyautogui.FAILSAFE = True
     pyautogui.PAUSE = 0.1
-    
-    gesture_control = YouTubeShortsGestureControl()
+
+    gesture_control = YouTubeShortsGestureControl(debug='--debug' in sys.argv)
     gesture_control.run()
\ No newline at end of file